@@ -59,6 +59,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             hass.data[DOMAIN][entry.entry_id].update({
                 "profiles": payload.get("profiles") or [],
                 "device_binds": payload.get("device_binds") or {},
+                "initial_payload": payload,
             })
     except FeelfitApiError as err:
         _LOGGER.debug("Initial fetch failed (will retry via coordinator): %s", err)
@@ -78,7 +79,7 @@ async def async_update_options(hass: HomeAssistant, entry: ConfigEntry) -> None:
     new_selected = entry.options.get(CONF_SELECTED_PROFILES, [])
     old_selected = entry.data.get(CONF_SELECTED_PROFILES, [])
 
-    removed_profiles = set(old_selected) - set(new_selected)
+    removed_profiles = {str(uid) for uid in old_selected} - {str(uid) for uid in new_selected}
 
     if removed_profiles:
         _LOGGER.debug("Removing entities for deselected profiles: %s", removed_profiles)
@@ -86,20 +87,16 @@ async def async_update_options(hass: HomeAssistant, entry: ConfigEntry) -> None:
         entity_registry = er.async_get(hass)
         device_registry = dr.async_get(hass)
 
-        devices_to_remove = []
-        for device_entry in device_registry.devices.values():
-
-            for identifier_tuple in device_entry.identifiers:
-                if identifier_tuple[0] == DOMAIN:
-                    device_id_str = identifier_tuple[1]
+        removed_identifiers = {(DOMAIN, f"user_{uid}") for uid in removed_profiles}
 
-                    if device_id_str.startswith("user_"):
-                        user_id = device_id_str.replace("user_", "")
-                        if user_id in removed_profiles:
-                            devices_to_remove.append(device_entry.id)
-                            _LOGGER.debug("Found device to remove: %s (user_id: %s)",
-                                        device_entry.name, user_id)
-                            break
+        devices_to_remove = []
+        for device_entry in dr.async_entries_for_config_entry(
+            device_registry, entry.entry_id
+        ):
+            if not removed_identifiers.isdisjoint(device_entry.identifiers):
+                devices_to_remove.append(device_entry.id)
+                _LOGGER.debug("Found device to remove: %s (identifiers: %s)",
+                            device_entry.name, device_entry.identifiers)
 
         for device_id in devices_to_remove:
             device_registry.async_remove_device(device_id)
@@ -110,14 +107,14 @@ async def async_update_options(hass: HomeAssistant, entry: ConfigEntry) -> None:
         else:
 
             entries_to_remove = []
-            for entity_entry in entity_registry.entities.values():
-                if entity_entry.config_entry_id == entry.entry_id:
-
-                    for removed_user_id in removed_profiles:
-                        if str(removed_user_id) in entity_entry.unique_id:
-                            entries_to_remove.append(entity_entry.entity_id)
-                            _LOGGER.debug("Removing entity: %s", entity_entry.entity_id)
-                            break
+            for entity_entry in er.async_entries_for_config_entry(
+                entity_registry, entry.entry_id
+            ):
+                # Profile sensor unique_ids are "<entry_id>_<key>_<user_id>".
+                uid = entity_entry.unique_id.rpartition("_")[2]
+                if uid in removed_profiles:
+                    entries_to_remove.append(entity_entry.entity_id)
+                    _LOGGER.debug("Removing entity: %s", entity_entry.entity_id)
 
             for entity_id in entries_to_remove:
                 entity_registry.async_remove(entity_id)
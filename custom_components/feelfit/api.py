@@ -3,32 +3,84 @@ from __future__ import annotations
 
 import asyncio
 import base64
-import copy
 import logging
 import time
 import urllib.parse
 from typing import Any
 
+import orjson
 from aiohttp import ClientSession, ClientTimeout
 from Crypto.Cipher import PKCS1_v1_5
-from Crypto.PublicKey import RSA
 
 from .const import (
     API_BASE,
     COMMON_HEADERS,
     DEFAULT_QUERY_PARAMS,
-    LOGIN_HEADERS,
+    DEFAULT_QUERY_STRING,
+    LOGIN_HEADERS_TUPLE,
     PATH_DEVICE_BINDS,
     PATH_GET_PRIMARY_USER,
     PATH_GOALS,
     PATH_LOGIN,
     PATH_MEASUREMENTS,
     PATH_USER_SETTINGS,
-    PUBLIC_KEY,
+    PUBLIC_KEY_OBJ,
 )
 
 _LOGGER = logging.getLogger("custom_components.feelfit.api")
 
+_DEFAULT_TIMEOUT = ClientTimeout(total=15)
+_RSA_CIPHER = PKCS1_v1_5.new(PUBLIC_KEY_OBJ)
+
+def _loads_json(body: bytes) -> Any:
+    """Decode a JSON body, returning None for an empty one like resp.json()."""
+    if not body.strip():
+        return None
+    return orjson.loads(body)
+
+def _pick_name(user: dict[str, Any], default: str) -> str:
+    """Return the first usable display name for a profile."""
+    for key in ("nickname", "name", "username"):
+        if user.get(key):
+            return user[key]
+    email = user.get("email")
+    if email:
+        return email.split("@", 1)[0] or default
+    return default
+
+def _enrich_device(
+    device: dict[str, Any],
+    model_by_scale_and_internal: dict[tuple[Any, Any], dict[str, Any]],
+    model_by_scale: dict[str, dict[str, Any]],
+) -> dict[str, Any]:
+    """Attach matching model and brand info to a bound device."""
+    match = model_by_scale_and_internal.get(
+        (device.get("scale_name"), device.get("internal_model"))
+    ) or model_by_scale.get(device.get("scale_name", ""))
+    if not match:
+        return device
+    merged = {**device, "model_info": match}
+    brand_name = (match.get("brand_info") or {}).get("brand_name")
+    if brand_name:
+        merged["brand_name"] = brand_name
+    return merged
+
+def _build_model_indexes(
+    device_models: list[dict[str, Any]],
+) -> tuple[dict[tuple[Any, Any], dict[str, Any]], dict[str, dict[str, Any]]]:
+    """Build the device model lookups used to enrich bound devices."""
+    # Iterate in reverse so the first model for each key wins.
+    model_by_scale_and_internal: dict[tuple[Any, Any], dict[str, Any]] = {
+        (m.get("scale_name"), m.get("internal_model")): m
+        for m in reversed(device_models)
+    }
+    model_by_scale: dict[str, dict[str, Any]] = {}
+    for m in device_models:
+        scale = m.get("scale_name")
+        if scale:
+            model_by_scale.setdefault(scale, m)
+    return model_by_scale_and_internal, model_by_scale
+
 class FeelfitApiError(Exception):
     """Exception for Feelfit API errors."""
 
@@ -40,16 +92,31 @@ class FeelfitApi:
         self.hass = hass
         self._session = session
         self.email = email
-        self.token: str | None = None
+        self._token: str | None = None
+        self._auth_headers: dict[str, str] = dict(COMMON_HEADERS)
         self.token_expires: float | None = None
         self.user_info: dict[str, Any] = {}
         self._last_measurements_meta: dict[str, dict[str, Any]] = {}
+        self._inflight: dict[tuple[str, tuple[tuple[str, str], ...]], asyncio.Future] = {}
+        self._inflight_waiters: dict[tuple[str, tuple[tuple[str, str], ...]], int] = {}
+
+    @property
+    def token(self) -> str | None:
+        """Return the current bearer token."""
+        return self._token
+
+    @token.setter
+    def token(self, token: str | None) -> None:
+        """Set the bearer token and rebuild the request headers."""
+        self._token = token
+        self._auth_headers = {**COMMON_HEADERS, **self.auth_header()}
 
     def _build_url(self, path: str, extra_params: dict[str, str] | None = None) -> str:
         """Build URL with query parameters."""
-        params = copy.deepcopy(DEFAULT_QUERY_PARAMS)
-        if extra_params:
-            params.update({k: str(v) for k, v in extra_params.items()})
+        if not extra_params:
+            return f"{API_BASE}{path}?{DEFAULT_QUERY_STRING}"
+        params = DEFAULT_QUERY_PARAMS.copy()
+        params.update({k: str(v) for k, v in extra_params.items()})
         query = urllib.parse.urlencode(params, safe="/")
         return f"{API_BASE}{path}?{query}"
 
@@ -61,17 +128,16 @@ class FeelfitApi:
         payload = {"email": self.email, "password": encrypted_pw}
 
         url = self._build_url(PATH_LOGIN)
-        timeout = ClientTimeout(total=15)
 
         try:
             async with self._session.post(
-                url, headers=LOGIN_HEADERS, json=payload, timeout=timeout
+                url, headers=LOGIN_HEADERS_TUPLE, json=payload, timeout=_DEFAULT_TIMEOUT
             ) as resp:
-                text = await resp.text()
                 if resp.status != 200:
+                    text = await resp.text()
                     _LOGGER.error("Login HTTP error %s: %s", resp.status, text)
                     raise FeelfitApiError(f"HTTP {resp.status}: {text}")
-                result = await resp.json(content_type=None)
+                result = _loads_json(await resp.read())
         except FeelfitApiError:
             raise
         except Exception as exc:
@@ -97,10 +163,8 @@ class FeelfitApi:
 
     def _encrypt_password(self, password: str) -> str:
         """Encrypt password with RSA public key."""
-        rsa_key = RSA.import_key(PUBLIC_KEY)
-        cipher = PKCS1_v1_5.new(rsa_key)
-        encrypted_bytes = cipher.encrypt(password.encode("utf-8"))
-        return base64.b64encode(encrypted_bytes).decode("utf-8")
+        encrypted_bytes = _RSA_CIPHER.encrypt(password.encode("utf-8"))
+        return base64.b64encode(encrypted_bytes).decode("ascii")
 
     def auth_header(self) -> dict[str, str]:
         """Return authorization header."""
@@ -111,20 +175,52 @@ class FeelfitApi:
     async def _get(
         self, path: str, extra_params: dict[str, str] | None = None
     ) -> dict[str, Any]:
-        """Perform GET request to API."""
+        """Perform GET request to API, sharing identical in-flight requests."""
+        key = (path, tuple(sorted(extra_params.items())) if extra_params else ())
+        future = self._inflight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(self._request(path, extra_params))
+            self._inflight[key] = future
+
+            self._inflight_waiters[key] = 0
+
+            def _done(fut: asyncio.Future) -> None:
+                self._inflight.pop(key, None)
+                self._inflight_waiters.pop(key, None)
+                if not fut.cancelled():
+                    # Mark the exception retrieved if every waiter went away.
+                    fut.exception()
+
+            future.add_done_callback(_done)
+
+        self._inflight_waiters[key] += 1
+        try:
+            return await asyncio.shield(future)
+        except asyncio.CancelledError:
+            # The shield keeps one cancelled caller from failing the others;
+            # once the last caller is gone, cancel the request itself.
+            if self._inflight.get(key) is future and self._inflight_waiters[key] == 1:
+                future.cancel()
+            raise
+        finally:
+            if self._inflight.get(key) is future:
+                self._inflight_waiters[key] -= 1
+
+    async def _request(
+        self, path: str, extra_params: dict[str, str] | None = None
+    ) -> dict[str, Any]:
+        """Perform a single GET request to API."""
         url = self._build_url(path, extra_params)
-        headers = {**COMMON_HEADERS, **self.auth_header()}
-        timeout = ClientTimeout(total=15)
 
         try:
             async with self._session.get(
-                url, headers=headers, timeout=timeout
+                url, headers=self._auth_headers, timeout=_DEFAULT_TIMEOUT
             ) as resp:
-                text = await resp.text()
                 if resp.status != 200:
+                    text = await resp.text()
                     _LOGGER.error("GET %s returned %s: %s", url, resp.status, text)
                     raise FeelfitApiError(f"HTTP {resp.status}: {text}")
-                result = await resp.json(content_type=None)
+                result = _loads_json(await resp.read())
         except FeelfitApiError:
             raise
         except Exception as exc:
@@ -159,12 +255,19 @@ class FeelfitApi:
             raise FeelfitApiError("Not authenticated")
         return await self._get(PATH_DEVICE_BINDS)
 
-    async def async_list_all_profiles(self) -> list[dict[str, Any]]:
-        """List all user profiles (primary + sub users)."""
+    async def async_list_all_profiles(
+        self,
+    ) -> tuple[list[dict[str, Any]], dict[str, Any]]:
+        """List all user profiles (primary + sub users).
+
+        Returns the profiles together with the raw primary user response so
+        callers do not have to fetch it again.
+        """
         if not self.token:
             raise FeelfitApiError("Not authenticated")
 
         profiles: list[dict[str, Any]] = []
+        primary_data: dict[str, Any] = {}
 
         try:
             primary_data = await self._get(PATH_GET_PRIMARY_USER)
@@ -174,12 +277,8 @@ class FeelfitApi:
                 primary_user["is_primary"] = True
 
                 if not primary_user.get("account_name"):
-                    primary_user["account_name"] = (
-                        primary_user.get("nickname") or
-                        primary_user.get("name") or
-                        primary_user.get("username") or
-                        primary_user.get("email", "").split("@")[0] if primary_user.get("email") else None or
-                        "Profilo Primario"
+                    primary_user["account_name"] = _pick_name(
+                        primary_user, "Profilo Primario"
                     )
                 _LOGGER.debug("Primary profile: user_id=%s, account_name=%s",
                              primary_user.get("user_id"),
@@ -211,13 +310,7 @@ class FeelfitApi:
                 user["is_primary"] = False
 
                 if not user.get("account_name"):
-                    user["account_name"] = (
-                        user.get("nickname") or
-                        user.get("name") or
-                        user.get("username") or
-                        user.get("email", "").split("@")[0] if user.get("email") else None or
-                        f"Profilo {idx + 2}"
-                    )
+                    user["account_name"] = _pick_name(user, f"Profilo {idx + 2}")
                 _LOGGER.debug("Sub user %d: user_id=%s, account_name=%s",
                              idx + 1,
                              user.get("user_id"),
@@ -230,7 +323,7 @@ class FeelfitApi:
         _LOGGER.info("Found %d profiles total: %s",
                      len(profiles),
                      [f"{p.get('account_name')} (id={p.get('user_id')})" for p in profiles])
-        return profiles
+        return profiles, primary_data
 
     async def async_get_last_measurements(
         self, user_id: str, last_updated_at: int = 0, last_measurement_id: int = 0
@@ -245,222 +338,24 @@ class FeelfitApi:
         }
         return await self._get(PATH_MEASUREMENTS, extra)
 
-    async def async_fetch_all(
-        self, user_id: str, selected_profiles: list[str] | None = None
-    ) -> dict[str, Any]:
-        """Fetch all data from API for selected profiles.
+    async def _fetch_profile(
+        self, profile: dict[str, Any]
+    ) -> tuple[dict[str, Any], dict[str, Any]]:
+        """Fetch goals and measurements for a single profile.
 
-        Args:
-            user_id: Primary user ID (for backward compatibility)
-            selected_profiles: List of user_ids to fetch. If None, fetch all profiles.
+        Returns the profile data and the measurements meta update to apply,
+        so concurrent fetches never mutate shared state.
         """
-        if not self.token:
-            raise FeelfitApiError("Not authenticated")
-
-        all_profiles: list[dict[str, Any]] = []
-        primary_data: dict[str, Any] = {}
-
-        try:
-            all_profiles = await self.async_list_all_profiles()
-            primary_data = await self.async_get_primary_user()
-            if isinstance(primary_data, dict) and "user_info" in primary_data:
-                self.user_info = primary_data.get("user_info") or self.user_info
-        except Exception as exc:
-            _LOGGER.debug("Could not fetch profiles: %s", exc)
-
-        if selected_profiles:
-            profiles_to_fetch = [
-                p for p in all_profiles
-                if str(p.get("user_id")) in selected_profiles
-            ]
-            _LOGGER.debug(
-                "Fetching %d of %d profiles based on selection",
-                len(profiles_to_fetch),
-                len(all_profiles)
-            )
-        else:
-            profiles_to_fetch = all_profiles
-            _LOGGER.debug("Fetching all %d profiles", len(profiles_to_fetch))
-
-        all_profiles_data: list[dict[str, Any]] = []
-
-        for profile in profiles_to_fetch:
-            profile_user_id = str(profile.get("user_id"))
-            _LOGGER.debug("Fetching data for profile: %s", profile.get("account_name"))
-
-            last_known_meta = self._last_measurements_meta.get(profile_user_id, {})
-            last_known_updated_at = int(last_known_meta.get("last_updated_at") or 0)
-            primary_ts = 0
-
-            try:
-                if profile.get("time_stamp"):
-                    primary_ts = int(profile.get("time_stamp"))
-            except (ValueError, TypeError):
-                primary_ts = 0
-
-            if last_known_updated_at > 0:
-                request_last_updated_at = last_known_updated_at
-            elif primary_ts > 0:
-                request_last_updated_at = primary_ts
-            else:
-                request_last_updated_at = 0
-
-            last_measurement_id = int(last_known_meta.get("last_measurement_id", 0) or 0)
-
-            _LOGGER.debug(
-                "Profile %s measurements fetch: last_known=%s primary_ts=%s request=%s measurement_id=%s",
-                profile.get("account_name"),
-                last_known_updated_at,
-                primary_ts,
-                request_last_updated_at,
-                last_measurement_id,
-            )
-
-            tasks = [
-                self.async_get_user_settings(),
-                self.async_list_goals(profile_user_id),
-                self.async_get_last_measurements(
-                    profile_user_id,
-                    last_updated_at=request_last_updated_at,
-                    last_measurement_id=last_measurement_id,
-                ),
-            ]
-            results = await asyncio.gather(*tasks, return_exceptions=True)
-
-            user_settings: dict[str, Any] = {}
-            goals: dict[str, Any] = {}
-            measurements_data: dict[str, Any] = {}
-
-            for idx, res in enumerate(results):
-                if isinstance(res, Exception):
-                    _LOGGER.error("Error fetching index %s for profile %s: %s",
-                                idx, profile.get("account_name"), res)
-                    continue
-                if idx == 0:
-                    user_settings = res or {}
-                elif idx == 1:
-                    goals = res or {}
-                elif idx == 2:
-                    measurements_data = res or {}
-
-            measurements_list = measurements_data.get("measurements") or []
-            if not measurements_list and primary_ts and primary_ts != last_known_updated_at:
-                _LOGGER.debug(
-                    "Profile %s measurements empty, retrying with last_updated_at=0 as fallback",
-                    profile.get("account_name")
-                )
-                try:
-                    fallback = await self.async_get_last_measurements(
-                        profile_user_id, last_updated_at=0, last_measurement_id=0
-                    )
-                    measurements_data = fallback or {}
-                    measurements_list = measurements_data.get("measurements") or []
-                except Exception as exc:
-                    _LOGGER.debug("Fallback measurements fetch failed for profile %s: %s",
-                                profile.get("account_name"), exc)
-
-            try:
-                returned_last_updated_at = int(measurements_data.get("last_updated_at") or 0)
-                returned_last_measurement_id = measurements_data.get("last_measurement_id") or 0
-
-                if profile_user_id not in self._last_measurements_meta:
-                    self._last_measurements_meta[profile_user_id] = {}
-
-                if returned_last_updated_at:
-                    self._last_measurements_meta[profile_user_id]["last_updated_at"] = returned_last_updated_at
-                if returned_last_measurement_id:
-                    self._last_measurements_meta[profile_user_id]["last_measurement_id"] = returned_last_measurement_id
-
-                _LOGGER.debug("Updated measurements meta for profile %s: %s",
-                            profile.get("account_name"),
-                            self._last_measurements_meta[profile_user_id])
-            except (ValueError, TypeError):
-                _LOGGER.debug(
-                    "Could not update measurements meta for profile %s from response: %s",
-                    profile.get("account_name"),
-                    measurements_data
-                )
-
-            last_measurement = measurements_list[0] if measurements_list else None
-
-            profile_data = {
-                "user_info": profile,
-                "user_settings": user_settings,
-                "goals": goals,
-                "measurements": {
-                    "last_measurement": last_measurement,
-                    "measurements": measurements_list,
-                    "last_updated_at": measurements_data.get("last_updated_at"),
-                },
-            }
-            all_profiles_data.append(profile_data)
-
-        device_binds_data: dict[str, Any] = {}
-        try:
-            device_binds_data = await self.async_list_device_binds()
-        except Exception as exc:
-            _LOGGER.error("Error fetching device binds: %s", exc)
-
-        device_binds = device_binds_data.get("device_binds") or []
-        device_models = device_binds_data.get("device_models") or []
-
-        model_by_scale_and_internal: dict[tuple[Any, Any], dict[str, Any]] = {}
-        model_by_scale: dict[str, dict[str, Any]] = {}
-
-        for m in device_models:
-            key = (m.get("scale_name"), m.get("internal_model"))
-            if key not in model_by_scale_and_internal:
-                model_by_scale_and_internal[key] = m
-            scale = m.get("scale_name")
-            if scale and scale not in model_by_scale:
-                model_by_scale[scale] = m
-
-        enriched_devices: list[dict[str, Any]] = []
-        for d in device_binds:
-            match = model_by_scale_and_internal.get(
-                (d.get("scale_name"), d.get("internal_model"))
-            )
-            if not match:
-                match = model_by_scale.get(d.get("scale_name", ""))
-            merged = dict(d)
-            if match:
-                merged["model_info"] = match
-                brand = match.get("brand_info") or {}
-                if brand.get("brand_name"):
-                    merged["brand_name"] = brand.get("brand_name")
-            enriched_devices.append(merged)
-
-        return {
-            "profiles": all_profiles_data,
-            "all_profiles": all_profiles,
-            "device_binds": {
-                "device_binds": enriched_devices,
-                "device_models": device_models,
-            },
-            "primary_user": primary_data or {},
-        }
-        """Fetch all data from API."""
-        if not self.token:
-            raise FeelfitApiError("Not authenticated")
+        profile_user_id = str(profile.get("user_id"))
+        _LOGGER.debug("Fetching data for profile: %s", profile.get("account_name"))
 
-        primary_data: dict[str, Any] = {}
-        try:
-            primary_data = await self.async_get_primary_user()
-            if isinstance(primary_data, dict) and "user_info" in primary_data:
-                self.user_info = primary_data.get("user_info") or self.user_info
-        except Exception as exc:
-            _LOGGER.debug("Could not fetch primary user: %s", exc)
-
-        last_known_meta = self._last_measurements_meta or {}
+        last_known_meta = self._last_measurements_meta.get(profile_user_id, {})
         last_known_updated_at = int(last_known_meta.get("last_updated_at") or 0)
         primary_ts = 0
 
         try:
-            pu = primary_data.get("user_info") if isinstance(primary_data, dict) else None
-            if pu and pu.get("time_stamp"):
-                primary_ts = int(pu.get("time_stamp"))
-            elif self.user_info and self.user_info.get("time_stamp"):
-                primary_ts = int(self.user_info.get("time_stamp"))
+            if profile.get("time_stamp"):
+                primary_ts = int(profile.get("time_stamp"))
         except (ValueError, TypeError):
             primary_ts = 0
 
@@ -474,113 +369,186 @@ class FeelfitApi:
         last_measurement_id = int(last_known_meta.get("last_measurement_id", 0) or 0)
 
         _LOGGER.debug(
-            "Measurements fetch: last_known=%s primary_ts=%s request=%s measurement_id=%s",
+            "Profile %s measurements fetch: last_known=%s primary_ts=%s request=%s measurement_id=%s",
+            profile.get("account_name"),
             last_known_updated_at,
             primary_ts,
             request_last_updated_at,
             last_measurement_id,
         )
 
-        tasks = [
-            self.async_get_user_settings(),
-            self.async_list_goals(user_id),
-            self.async_list_device_binds(),
+        goals_res, measurements_res = await asyncio.gather(
+            self.async_list_goals(profile_user_id),
             self.async_get_last_measurements(
-                user_id,
+                profile_user_id,
                 last_updated_at=request_last_updated_at,
                 last_measurement_id=last_measurement_id,
             ),
-        ]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+            return_exceptions=True,
+        )
 
-        user_settings: dict[str, Any] = {}
         goals: dict[str, Any] = {}
-        device_binds_data: dict[str, Any] = {}
+        if isinstance(goals_res, Exception):
+            _LOGGER.error("Error fetching goals for profile %s: %s",
+                        profile.get("account_name"), goals_res)
+        else:
+            goals = goals_res or {}
+
         measurements_data: dict[str, Any] = {}
+        if isinstance(measurements_res, Exception):
+            _LOGGER.error("Error fetching measurements for profile %s: %s",
+                        profile.get("account_name"), measurements_res)
+        else:
+            measurements_data = measurements_res or {}
 
-        for idx, res in enumerate(results):
-            if isinstance(res, Exception):
-                _LOGGER.error("Error fetching index %s: %s", idx, res)
-                continue
-            if idx == 0:
-                user_settings = res or {}
-            elif idx == 1:
-                goals = res or {}
-            elif idx == 2:
-                device_binds_data = res or {}
-            elif idx == 3:
-                measurements_data = res or {}
+        meta_update: dict[str, Any] = {}
 
         measurements_list = measurements_data.get("measurements") or []
-        if not measurements_list and primary_ts and primary_ts != last_known_updated_at:
+        # A full-history retry that came back empty for this primary_ts cannot
+        # find anything new until the profile's time_stamp moves on.
+        if (
+            not measurements_list
+            and primary_ts
+            and primary_ts != last_known_updated_at
+            and primary_ts != last_known_meta.get("empty_fallback_ts")
+        ):
             _LOGGER.debug(
-                "Measurements empty, retrying with last_updated_at=0 as fallback"
+                "Profile %s measurements empty, retrying with last_updated_at=0 as fallback",
+                profile.get("account_name")
             )
             try:
                 fallback = await self.async_get_last_measurements(
-                    user_id, last_updated_at=0, last_measurement_id=0
+                    profile_user_id, last_updated_at=0, last_measurement_id=0
                 )
                 measurements_data = fallback or {}
                 measurements_list = measurements_data.get("measurements") or []
+                if not measurements_list:
+                    meta_update["empty_fallback_ts"] = primary_ts
             except Exception as exc:
-                _LOGGER.debug("Fallback measurements fetch failed: %s", exc)
+                _LOGGER.debug("Fallback measurements fetch failed for profile %s: %s",
+                            profile.get("account_name"), exc)
 
         try:
             returned_last_updated_at = int(measurements_data.get("last_updated_at") or 0)
             returned_last_measurement_id = measurements_data.get("last_measurement_id") or 0
+
             if returned_last_updated_at:
-                self._last_measurements_meta["last_updated_at"] = returned_last_updated_at
+                meta_update["last_updated_at"] = returned_last_updated_at
             if returned_last_measurement_id:
-                self._last_measurements_meta["last_measurement_id"] = returned_last_measurement_id
-            _LOGGER.debug("Updated measurements meta: %s", self._last_measurements_meta)
+                meta_update["last_measurement_id"] = returned_last_measurement_id
         except (ValueError, TypeError):
             _LOGGER.debug(
-                "Could not update measurements meta from response: %s", measurements_data
+                "Could not update measurements meta for profile %s from response: %s",
+                profile.get("account_name"),
+                measurements_data
             )
 
+        last_measurement = measurements_list[0] if measurements_list else None
+
+        profile_data = {
+            "user_info": profile,
+            "user_settings": {},
+            "goals": goals,
+            "measurements": {
+                "last_measurement": last_measurement,
+                "measurements": measurements_list,
+                "last_updated_at": measurements_data.get("last_updated_at"),
+            },
+        }
+        return profile_data, meta_update
+
+    async def async_fetch_all(
+        self, user_id: str, selected_profiles: list[str] | None = None
+    ) -> dict[str, Any]:
+        """Fetch all data from API for selected profiles.
+
+        Args:
+            user_id: Primary user ID (for backward compatibility)
+            selected_profiles: List of user_ids to fetch. If None, fetch all profiles.
+        """
+        if not self.token:
+            raise FeelfitApiError("Not authenticated")
+
+        all_profiles: list[dict[str, Any]] = []
+        primary_data: dict[str, Any] = {}
+
+        try:
+            all_profiles, primary_data = await self.async_list_all_profiles()
+            if isinstance(primary_data, dict) and "user_info" in primary_data:
+                self.user_info = primary_data.get("user_info") or self.user_info
+        except Exception as exc:
+            _LOGGER.debug("Could not fetch profiles: %s", exc)
+
+        if selected_profiles:
+            profiles_to_fetch = [
+                p for p in all_profiles
+                if str(p.get("user_id")) in selected_profiles
+            ]
+            _LOGGER.debug(
+                "Fetching %d of %d profiles based on selection",
+                len(profiles_to_fetch),
+                len(all_profiles)
+            )
+        else:
+            profiles_to_fetch = all_profiles
+            _LOGGER.debug("Fetching all %d profiles", len(profiles_to_fetch))
+
+        # One gather, so cancelling the refresh cancels every pending request.
+        user_settings_res, device_binds_res, *results = await asyncio.gather(
+            self.async_get_user_settings(),
+            self.async_list_device_binds(),
+            *(self._fetch_profile(p) for p in profiles_to_fetch),
+            return_exceptions=True,
+        )
+
+        user_settings: dict[str, Any] = {}
+        if isinstance(user_settings_res, Exception):
+            _LOGGER.error("Error fetching user settings: %s", user_settings_res)
+        else:
+            user_settings = user_settings_res or {}
+
+        device_binds_data: dict[str, Any] = {}
+        if isinstance(device_binds_res, Exception):
+            _LOGGER.error("Error fetching device binds: %s", device_binds_res)
+        else:
+            device_binds_data = device_binds_res or {}
+
+        all_profiles_data: list[dict[str, Any]] = []
+
+        for profile, res in zip(profiles_to_fetch, results):
+            if isinstance(res, Exception):
+                _LOGGER.error("Error fetching data for profile %s: %s",
+                            profile.get("account_name"), res)
+                continue
+
+            profile_data, meta_update = res
+            profile_data["user_settings"] = user_settings
+
+            if meta_update:
+                profile_user_id = str(profile.get("user_id"))
+                meta = self._last_measurements_meta.setdefault(profile_user_id, {})
+                meta.update(meta_update)
+                _LOGGER.debug("Updated measurements meta for profile %s: %s",
+                            profile.get("account_name"), meta)
+
+            all_profiles_data.append(profile_data)
+
         device_binds = device_binds_data.get("device_binds") or []
         device_models = device_binds_data.get("device_models") or []
 
-        model_by_scale_and_internal: dict[tuple[Any, Any], dict[str, Any]] = {}
-        model_by_scale: dict[str, dict[str, Any]] = {}
-
-        for m in device_models:
-            key = (m.get("scale_name"), m.get("internal_model"))
-            if key not in model_by_scale_and_internal:
-                model_by_scale_and_internal[key] = m
-            scale = m.get("scale_name")
-            if scale and scale not in model_by_scale:
-                model_by_scale[scale] = m
-
-        enriched_devices: list[dict[str, Any]] = []
-        for d in device_binds:
-            match = model_by_scale_and_internal.get(
-                (d.get("scale_name"), d.get("internal_model"))
-            )
-            if not match:
-                match = model_by_scale.get(d.get("scale_name", ""))
-            merged = dict(d)
-            if match:
-                merged["model_info"] = match
-                brand = match.get("brand_info") or {}
-                if brand.get("brand_name"):
-                    merged["brand_name"] = brand.get("brand_name")
-            enriched_devices.append(merged)
+        model_by_scale_and_internal, model_by_scale = _build_model_indexes(device_models)
 
-        last_measurement = measurements_list[0] if measurements_list else None
+        enriched_devices = [
+            _enrich_device(d, model_by_scale_and_internal, model_by_scale)
+            for d in device_binds
+        ]
 
         return {
-            "user_info": self.user_info,
-            "user_settings": user_settings,
-            "goals": goals,
+            "profiles": all_profiles_data,
+            "all_profiles": all_profiles,
             "device_binds": {
                 "device_binds": enriched_devices,
                 "device_models": device_models,
             },
-            "measurements": {
-                "last_measurement": last_measurement,
-                "measurements": measurements_list,
-                "last_updated_at": measurements_data.get("last_updated_at"),
-            },
             "primary_user": primary_data or {},
         }
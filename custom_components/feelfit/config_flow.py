@@ -1,6 +1,8 @@
 """Config flow for Feelfit integration."""
 from __future__ import annotations
 
+import asyncio
+import functools
 import logging
 from typing import Any
 
@@ -27,15 +29,102 @@ STEP_USER_DATA_SCHEMA = vol.Schema(
 
 async def validate_input(
     hass: HomeAssistant, data: dict[str, Any]
-) -> dict[str, Any]:
-    """Validate the user input allows us to connect."""
+) -> tuple[FeelfitApi, dict[str, Any]]:
+    """Validate the user input allows us to connect.
+
+    Returns the logged-in client so later steps can keep using it.
+    """
     session: ClientSession = async_get_clientsession(hass)
-    client = FeelfitApi(hass, session, data["email"].strip())
+    client = FeelfitApi(hass, session, data["email"])
 
     login_data = await client.async_login(data["password"])
-    return login_data
+    return client, login_data
+
+_BOOLEAN_SELECTOR = selector.BooleanSelector()
+
+@functools.lru_cache(maxsize=256)
+def _make_optional(label: str, default: bool, suggest_default: bool) -> vol.Optional:
+    """Return a (memoized) optional profile checkbox marker."""
+    if suggest_default:
+        return vol.Optional(label, default=default, description={"suggested_value": default})
+    return vol.Optional(label, default=default)
+
+def _build_label(profile: dict[str, Any]) -> str:
+    """Build the selection label shown for a profile."""
+    label = f"{profile.get('account_name', 'Profilo sconosciuto')}"
+    if profile.get("is_primary"):
+        label += " (Primario)"
+    email = profile.get("email")
+    if email:
+        label += f" - {email}"
+    return label
+
+class _ProfileSelectionMixin:
+    """Shared profile bookkeeping for the config and options flows.
+
+    Profile state starts as None and is allocated by _set_profiles, so flows
+    that never get past the first form do not build it.
+    """
+
+    def _reset_profiles(self) -> None:
+        """Clear the profile state; called from each flow's __init__."""
+        self._all_profiles: list[dict[str, Any]] | None = None
+        self._label_to_user_id: dict[str, str] | None = None
+        self._user_id_to_label: dict[str, str] | None = None
+        self._primary_user_id: str | None = None
+        self._profiles_compact: list[dict[str, Any]] | None = None
+        self._label_entries: tuple[tuple[str, bool], ...] | None = None
+        self._profiles_schema_key: tuple[tuple[tuple[str, bool], ...], bool] | None = None
+        self._profiles_schema: vol.Schema | None = None
+
+    def _set_profiles(self, profiles: list[dict[str, Any]]) -> None:
+        """Store fetched profiles and index their labels in one pass."""
+        self._all_profiles = profiles
+        self._profiles_compact = []
+        primary = next(
+            (p for p in profiles if p.get("is_primary", False)),
+            profiles[0] if profiles else None
+        )
+        self._primary_user_id = str(primary.get("user_id")) if primary else None
+        self._label_to_user_id = {}
+        self._user_id_to_label = {}
+        for profile in profiles:
+            user_id = str(profile.get("user_id"))
+            label = _build_label(profile)
+            self._label_to_user_id[label] = user_id
+            self._user_id_to_label[user_id] = label
+            self._profiles_compact.append({
+                "user_id": user_id,
+                "account_name": profile.get("account_name"),
+                "is_primary": bool(profile.get("is_primary", False)),
+            })
+        self._label_entries = tuple(
+            (self._user_id_to_label[p["user_id"]], p["is_primary"])
+            for p in self._profiles_compact
+        )
 
-class FeelfitConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
+    def _selected_user_ids(self, user_input: dict[str, Any]) -> list[str]:
+        """Map the checked profile labels back to their user ids."""
+        return [
+            self._label_to_user_id[label]
+            for label, chosen in user_input.items()
+            if chosen and label in self._label_to_user_id
+        ]
+
+    def _get_profiles_schema(
+        self, entries: tuple[tuple[str, bool], ...], suggest_default: bool = False
+    ) -> vol.Schema:
+        """Return the profile checkbox schema, reusing it while entries match."""
+        key = (entries, suggest_default)
+        if self._profiles_schema is None or self._profiles_schema_key != key:
+            self._profiles_schema_key = key
+            self._profiles_schema = vol.Schema({
+                _make_optional(label, default, suggest_default): _BOOLEAN_SELECTOR
+                for label, default in entries
+            })
+        return self._profiles_schema
+
+class FeelfitConfigFlow(_ProfileSelectionMixin, config_entries.ConfigFlow, domain=DOMAIN):
     """Handle a config flow for Feelfit."""
 
     VERSION = 1
@@ -44,10 +133,9 @@ class FeelfitConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         """Initialize the config flow."""
         self._email: str | None = None
         self._token: str | None = None
-        self._token_expires: str | None = None
-        self._user_info: dict[str, Any] = {}
-        self._all_profiles: list[dict[str, Any]] = []
-        self._label_to_user_id: dict[str, str] = {}
+        self._token_expires: int | None = None
+        self._user_info: dict[str, Any] | None = None
+        self._reset_profiles()
 
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
@@ -56,8 +144,9 @@ class FeelfitConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         errors: dict[str, str] = {}
 
         if user_input is not None:
+            user_input["email"] = user_input["email"].strip()
             try:
-                login_data = await validate_input(self.hass, user_input)
+                client, login_data = await validate_input(self.hass, user_input)
             except FeelfitApiError as exc:
                 _LOGGER.debug("Login attempt failed: %s", exc)
                 errors["base"] = "invalid_auth"
@@ -70,29 +159,30 @@ class FeelfitConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 token_info = login_data.get("token_info", {})
                 self._token = token_info.get("token")
                 remaining_time = token_info.get("remaining_time")
-                self._token_expires = str(int(remaining_time)) if remaining_time else None
-                self._email = user_input["email"].strip()
+                self._token_expires = int(remaining_time) if remaining_time else None
+                self._email = user_input["email"]
 
-                session = async_get_clientsession(self.hass)
-                client = FeelfitApi(self.hass, session, self._email)
-                client.token = self._token
+                if not client.token:
+                    client.token = self._token
 
                 try:
-                    self._all_profiles = await client.async_list_all_profiles()
-                    _LOGGER.debug("Found %d profiles", len(self._all_profiles))
-                    for idx, p in enumerate(self._all_profiles):
+                    profiles, _ = await client.async_list_all_profiles()
+                    if _LOGGER.isEnabledFor(logging.DEBUG):
                         _LOGGER.debug(
-                            "Profile %d: user_id=%s, account_name=%s, nickname=%s, email=%s, is_primary=%s",
-                            idx + 1,
-                            p.get("user_id"),
-                            p.get("account_name"),
-                            p.get("nickname"),
-                            p.get("email"),
-                            p.get("is_primary")
+                            "Found %d profiles:\n%s",
+                            len(profiles),
+                            "\n".join(
+                                f"Profile {idx + 1}: user_id={p.get('user_id')}, "
+                                f"account_name={p.get('account_name')}, nickname={p.get('nickname')}, "
+                                f"email={p.get('email')}, is_primary={p.get('is_primary')}"
+                                for idx, p in enumerate(profiles)
+                            ),
                         )
-                except Exception as exc:
+                except (FeelfitApiError, asyncio.TimeoutError) as exc:
                     _LOGGER.error("Failed to fetch profiles: %s", exc)
-                    self._all_profiles = [self._user_info]
+                    profiles = [self._user_info]
+
+                self._set_profiles(profiles)
 
                 return await self.async_step_select_profiles()
 
@@ -108,20 +198,11 @@ class FeelfitConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         """Handle profile selection step."""
         if user_input is not None:
 
-            selected = []
-            for label, is_selected in user_input.items():
-                if is_selected and label != CONF_SELECTED_PROFILES:
-
-                    user_id = self._label_to_user_id.get(label, label)
-                    selected.append(user_id)
+            selected = self._selected_user_ids(user_input)
 
             if not selected:
 
-                primary = next(
-                    (p for p in self._all_profiles if p.get("is_primary", False)),
-                    self._all_profiles[0] if self._all_profiles else self._user_info
-                )
-                selected = [str(primary.get("user_id"))]
+                selected = [self._primary_user_id or str(self._user_info.get("user_id"))]
 
             unique_id = self._user_info.get("user_id") or self._email
             await self.async_set_unique_id(str(unique_id))
@@ -133,14 +214,7 @@ class FeelfitConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 "token_expires": self._token_expires,
                 "user_info": self._user_info,
                 CONF_SELECTED_PROFILES: selected,
-                CONF_PROFILES_LIST: [
-                    {
-                        "user_id": str(p.get("user_id")),
-                        "account_name": p.get("account_name"),
-                        "is_primary": p.get("is_primary", False),
-                    }
-                    for p in self._all_profiles
-                ],
+                CONF_PROFILES_LIST: self._profiles_compact,
             }
 
             title = self._user_info.get("account_name") or self._email
@@ -149,35 +223,14 @@ class FeelfitConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
             return self.async_create_entry(title=title, data=entry_data)
 
-        profiles_schema = {}
-        for profile in self._all_profiles:
-            user_id = str(profile.get("user_id"))
-            account_name = profile.get("account_name", "Profilo sconosciuto")
-            is_primary = profile.get("is_primary", False)
-
-            label = f"{account_name}"
-            if is_primary:
-                label += " (Primario)"
-
-            email = profile.get("email")
-            if email:
-                label += f" - {email}"
+        entries = self._label_entries
 
-            _LOGGER.debug("Profile in UI: user_id=%s, label=%s", user_id, label)
-
-            profiles_schema[vol.Optional(label, default=is_primary, description={"suggested_value": is_primary})] = selector.BooleanSelector()
-
-        self._label_to_user_id = {}
-        for p in self._all_profiles:
-            account_name = p.get('account_name', 'Profilo sconosciuto')
-            is_primary_label = ' (Primario)' if p.get('is_primary') else ''
-            email_part = f" - {p.get('email')}" if p.get('email') else ''
-            label_key = f"{account_name}{is_primary_label}{email_part}"
-            self._label_to_user_id[label_key] = str(p.get("user_id"))
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("Profiles in UI: %s", entries)
 
         return self.async_show_form(
             step_id="select_profiles",
-            data_schema=vol.Schema(profiles_schema),
+            data_schema=self._get_profiles_schema(entries, suggest_default=True),
             description_placeholders={
                 "num_profiles": str(len(self._all_profiles))
             },
@@ -191,14 +244,12 @@ class FeelfitConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         """Get the options flow for this handler."""
         return FeelfitOptionsFlowHandler(config_entry)
 
-class FeelfitOptionsFlowHandler(config_entries.OptionsFlow):
+class FeelfitOptionsFlowHandler(_ProfileSelectionMixin, config_entries.OptionsFlow):
     """Handle Feelfit options."""
 
     def __init__(self, config_entry: config_entries.ConfigEntry) -> None:
         """Initialize options flow."""
-
-        self._all_profiles: list[dict[str, Any]] = []
-        self._label_to_user_id: dict[str, str] = {}
+        self._reset_profiles()
 
     async def async_step_init(
         self, user_input: dict[str, Any] | None = None
@@ -218,76 +269,52 @@ class FeelfitOptionsFlowHandler(config_entries.OptionsFlow):
         if not email or not token:
             return self.async_abort(reason="missing_credentials")
 
-        try:
-            session: ClientSession = async_get_clientsession(self.hass)
-            api = FeelfitApi(self.hass, session, email)
-            api.token = token
-            api.user_info = user_info
+        # Profiles are fetched when the form is first shown; submitting it
+        # only needs the labels mapped back to user ids.
+        if not self._all_profiles:
+            try:
+                session: ClientSession = async_get_clientsession(self.hass)
+                api = FeelfitApi(self.hass, session, email)
+                api.token = token
+                api.user_info = user_info
+
+                profiles, _ = await api.async_list_all_profiles()
 
-            self._all_profiles = await api.async_list_all_profiles()
+            except Exception as exc:
+                _LOGGER.error("Failed to fetch profiles in options: %s", exc, exc_info=True)
+                return self.async_abort(reason="fetch_failed")
 
-        except Exception as exc:
-            _LOGGER.error("Failed to fetch profiles in options: %s", exc, exc_info=True)
-            return self.async_abort(reason="fetch_failed")
+            self._set_profiles(profiles)
 
         if user_input is not None:
 
-            selected = []
-            for label, is_selected in user_input.items():
-                if is_selected:
-                    user_id = self._label_to_user_id.get(label, label)
-                    selected.append(user_id)
+            selected = self._selected_user_ids(user_input)
 
-            if not selected:
+            if not selected and self._primary_user_id:
 
-                primary = next(
-                    (p for p in self._all_profiles if p.get("is_primary", False)),
-                    self._all_profiles[0] if self._all_profiles else None
-                )
-                if primary:
-                    selected = [str(primary.get("user_id"))]
+                selected = [self._primary_user_id]
 
             return self.async_create_entry(
                 title="",
                 data={CONF_SELECTED_PROFILES: selected}
             )
 
-        profiles_schema = {}
-
-        current_selection = self.config_entry.options.get(
+        current_selection = frozenset(self.config_entry.options.get(
             CONF_SELECTED_PROFILES,
             self.config_entry.data.get(CONF_SELECTED_PROFILES, [])
-        )
+        ))
 
-        for profile in self._all_profiles:
-            user_id = str(profile.get("user_id"))
-            account_name = profile.get("account_name", "Profilo sconosciuto")
-            is_primary = profile.get("is_primary", False)
-
-            label = f"{account_name}"
-            if is_primary:
-                label += " (Primario)"
-
-            email_addr = profile.get("email")
-            if email_addr:
-                label += f" - {email_addr}"
-
-            is_selected = user_id in current_selection
-
-            _LOGGER.debug("Options profile: user_id=%s, label=%s, selected=%s", user_id, label, is_selected)
-
-            profiles_schema[vol.Optional(label, default=is_selected)] = selector.BooleanSelector()
+        entries = tuple(
+            (label, user_id in current_selection)
+            for user_id, label in self._user_id_to_label.items()
+        )
 
-        for p in self._all_profiles:
-            account_name = p.get('account_name', 'Profilo sconosciuto')
-            is_primary_label = ' (Primario)' if p.get('is_primary') else ''
-            email_part = f" - {p.get('email')}" if p.get('email') else ''
-            label_key = f"{account_name}{is_primary_label}{email_part}"
-            self._label_to_user_id[label_key] = str(p.get("user_id"))
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("Options profiles: %s", entries)
 
         return self.async_show_form(
             step_id="profiles",
-            data_schema=vol.Schema(profiles_schema),
+            data_schema=self._get_profiles_schema(entries),
             description_placeholders={
                 "num_profiles": str(len(self._all_profiles))
             },
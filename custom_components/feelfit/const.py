@@ -1,7 +1,11 @@
 """Constants for the Feelfit integration (centralized)."""
 
+import urllib.parse
 from datetime import timedelta
-from typing import Dict
+from types import MappingProxyType
+from typing import Mapping
+
+from Crypto.PublicKey import RSA
 
 DOMAIN = "feelfit"
 PLATFORMS = ["sensor"]
@@ -14,7 +18,7 @@ CONF_PROFILES_LIST = "profiles_list"
 
 API_BASE = "https://feelfit.qnclouds.com/api/v4"
 
-DEFAULT_QUERY_PARAMS: Dict[str, str] = {
+DEFAULT_QUERY_PARAMS: Mapping[str, str] = MappingProxyType({
     "app_revision": "4.16.0",
     "html_version": "14.16.0",
     "cellphone_type": "samsung SM-T510",
@@ -24,7 +28,9 @@ DEFAULT_QUERY_PARAMS: Dict[str, str] = {
     "locale": "it",
     "app_id": "Feelfit",
     "platform": "android",
-}
+})
+
+DEFAULT_QUERY_STRING = urllib.parse.urlencode(DEFAULT_QUERY_PARAMS, safe="/")
 
 PATH_LOGIN = "/users/sign_in"
 PATH_USER_SETTINGS = "/user_settings/show_common_setting"
@@ -40,15 +46,19 @@ Jr04fz2b2WCcN0ta/rbF2nYAnMVAk2OJVZAMudOiMWhcxV1nNJiKgTNNr13de0EQ
 IiOL2CUBzu+HmIfUbQIDAQAB
 -----END PUBLIC KEY-----"""
 
-COMMON_HEADERS: Dict[str, str] = {
+PUBLIC_KEY_OBJ = RSA.import_key(PUBLIC_KEY)
+
+COMMON_HEADERS: Mapping[str, str] = MappingProxyType({
     "Accept-Encoding": "gzip",
     "Connection": "Keep-Alive",
     "Host": "feelfit.qnclouds.com",
     "User-Agent": "okhttp/4.9.1",
-}
+})
 
-LOGIN_HEADERS: Dict[str, str] = {
+LOGIN_HEADERS: Mapping[str, str] = MappingProxyType({
     **COMMON_HEADERS,
     "Authorization": "Bearer",
     "Content-Type": "application/json;charset=UTF-8",
-}
+})
+
+LOGIN_HEADERS_TUPLE = tuple(LOGIN_HEADERS.items())
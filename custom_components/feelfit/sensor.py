@@ -1,13 +1,17 @@
 """Sensor platform for Feelfit — coordinator-backed entities (auto-refresh)."""
 from __future__ import annotations
 
+import functools
+import itertools
 import logging
+import re
 from datetime import datetime, timedelta
-from typing import Any
+from types import MappingProxyType
+from typing import Any, Callable, Iterator, Mapping
 
 from homeassistant.components.sensor import SensorEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import (
     CoordinatorEntity,
@@ -29,40 +33,373 @@ PERCENT = "%"
 KCAL = "kcal"
 BPM = "bpm"
 
+_MEASUREMENT_KEYS: tuple[tuple[str, str, str | None], ...] = (
+    ("weight", "Weight", KG_UNIT),
+    ("bodyfat", "Bodyfat", PERCENT),
+    ("bmi", "BMI", None),
+    ("bmr", "BMR", KCAL),
+    ("bodyage", "Metabolic Age", "y"),
+    ("fat_free_weight", "Fat Free Weight", KG_UNIT),
+    ("muscle", "Muscle (%)", PERCENT),
+    ("protein", "Protein (%)", PERCENT),
+    ("sinew", "Sinew", PERCENT),
+    ("subfat", "Subcutaneous Fat (%)", PERCENT),
+    ("visfat", "Visceral Fat", None),
+    ("water", "Hydration (%)", PERCENT),
+    ("bone", "Bone Mass", KG_UNIT),
+    ("heart_rate", "Heart Rate", BPM),
+    ("score", "Score", None),
+    ("time_stamp", "Measurement Timestamp", None),
+    ("body_water_mass", "Body Water Mass", KG_UNIT),
+    ("protein_mass", "Protein Mass", KG_UNIT),
+    ("body_fat_mass", "Body Fat Mass", KG_UNIT),
+)
+
+_from_ts = datetime.fromtimestamp
+
+_DATE_FORMAT_MAP = {"dd": "%d", "MM": "%m", "yyyy": "%Y", "yy": "%y"}
+_DATE_FORMAT_RE = re.compile(r"yyyy|yy|MM|dd")
+
+@functools.lru_cache(maxsize=32)
 def _map_date_format(fmt: str) -> str:
     """Map Feelfit date format to Python strftime format."""
     if not fmt:
         return "%Y-%m-%d"
-    mapping = {"dd": "%d", "MM": "%m", "yyyy": "%Y", "yy": "%y"}
-    out = fmt
-    for k, v in mapping.items():
-        out = out.replace(k, v)
-    return out
+    return _DATE_FORMAT_RE.sub(lambda m: _DATE_FORMAT_MAP[m.group(0)], fmt)
+
+@functools.lru_cache(maxsize=128)
+def _parse_and_format(raw: int | str, date_format: str) -> str:
+    """Parse a raw birthday and render it with the Feelfit date format."""
+    fmt = _map_date_format(date_format)
+    try:
+        if type(raw) is int:
+            return _from_ts(raw).strftime(fmt)
+        if raw.isdigit():
+            return _from_ts(int(raw)).strftime(fmt)
+    except (ValueError, OSError):
+        pass
+
+    raw_str = str(raw)
+    try:
+        dt = datetime.fromisoformat(raw_str)
+    except ValueError:
+        try:
+            dt = datetime.strptime(raw_str, "%Y-%m-%d")
+        except ValueError:
+            return raw_str
+    return dt.strftime(fmt)
 
 def _format_birthday(raw_birthday: Any, date_format: str | None) -> str | None:
     """Format birthday from various input formats."""
     if not raw_birthday:
         return None
-
+    if type(raw_birthday) is not int:
+        raw_birthday = str(raw_birthday)
+    return _parse_and_format(raw_birthday, date_format or "")
+
+def _iso_from_timestamp(raw: Any) -> Any:
+    """Convert a measurement epoch timestamp to an ISO string."""
+    if not raw:
+        return raw
     try:
-        if isinstance(raw_birthday, int):
-            dt = datetime.fromtimestamp(raw_birthday)
-            fmt = _map_date_format(date_format or "")
-            return dt.strftime(fmt)
-        if isinstance(raw_birthday, str) and raw_birthday.isdigit():
-            ts = int(raw_birthday)
-            dt = datetime.fromtimestamp(ts)
-            fmt = _map_date_format(date_format or "")
-            return dt.strftime(fmt)
+        return _from_ts(int(raw)).isoformat()
     except (ValueError, OSError):
-        pass
+        return str(raw)
+
+def _coerce_number(raw: Any) -> Any:
+    """Return a measurement as int when whole, else rounded to 2 decimals."""
+    if isinstance(raw, (int, float)):
+        fval = float(raw)
+    elif isinstance(raw, str):
+        # Only plain decimal literals are numbers; exponents, underscores,
+        # whitespace and nan/inf stay strings. Integers parse exactly.
+        cleaned = raw.replace(".", "", 1)
+        if not (cleaned.isdigit() or (cleaned[:1] == "-" and cleaned[1:].isdigit())):
+            return raw
+        try:
+            if "." not in raw:
+                return int(raw)
+            fval = float(raw)
+        except ValueError:
+            return raw
+    else:
+        return raw
+
+    if fval.is_integer():
+        return int(fval)
+    return round(fval, 2)
+
+def _coerce_int(raw: Any) -> Any:
+    """Return an integer-valued measurement (ids, ages) as int."""
+    if isinstance(raw, (int, float)):
+        try:
+            return int(raw)
+        except (ValueError, OverflowError):
+            return raw
+    return _coerce_number(raw)
+
+_COERCERS = {
+    "bodyage": _coerce_int,
+    "measurement_id": _coerce_int,
+    "user_id": _coerce_int,
+}
+
+def _profile_device_info(user_info: dict[str, Any], fallback_id: Any) -> dict[str, Any]:
+    """Build the device info for a Feelfit account profile."""
+    user_id = user_info.get("user_id") or fallback_id
+    return {
+        "identifiers": {(DOMAIN, f"user_{user_id}")},
+        "name": user_info.get("account_name") or f"Feelfit User {user_id}",
+        "manufacturer": "Feelfit",
+        "model": "Feelfit Account",
+    }
+
+_MEASUREMENT_ATTR_KEYS = (
+    "measurement_id",
+    "user_id",
+    "scale_name",
+    "internal_model",
+    "mac",
+    "parameter",
+    "accuracy_flag",
+    "measure_mode_flags",
+)
 
-    try:
-        dt = datetime.strptime(str(raw_birthday), "%Y-%m-%d")
-        fmt = _map_date_format(date_format or "")
-        return dt.strftime(fmt)
-    except ValueError:
-        return str(raw_birthday)
+_DEVICE_ATTR_KEYS = (
+    "user_id",
+    "mac",
+    "scale_name",
+    "internal_model",
+    "created_at",
+    "wifi_name",
+    "functure_type",
+    "device_name",
+    "switch_states",
+    "blood_standard",
+    "light_strip_status",
+    "sn",
+    "scale_setting",
+)
+
+def _device_attrs(d: dict[str, Any]) -> dict[str, Any]:
+    """Build the state attributes for a bound device."""
+    attrs = {key: d[key] for key in _DEVICE_ATTR_KEYS if key in d}
+
+    model_info = d.get("model_info")
+    if isinstance(model_info, dict):
+        for mk, mv in model_info.items():
+            if mk == "brand_info" and isinstance(mv, dict):
+                for bk, bv in mv.items():
+                    attrs[f"model_brand_{bk}"] = bv
+                brand_name = mv.get("brand_name")
+                if brand_name:
+                    attrs["brand_name"] = brand_name
+            else:
+                attrs[f"model_{mk}"] = mv
+    if model_info is None and d.get("internal_model"):
+        attrs["model_internal_model"] = d.get("internal_model")
+    return attrs
+
+def _bound_device_info(d: dict[str, Any], idx: int, user_id: Any) -> dict[str, Any]:
+    """Build the device info for a bound scale."""
+    scale_name = d.get("scale_name") or d.get("internal_model") or f"Device {idx}"
+    model_info = d.get("model_info") or {}
+    brand_info = model_info.get("brand_info") or {}
+    brand = d.get("brand_name") or brand_info.get("brand_name")
+    friendly_name = f"Feelfit {scale_name}"
+    if brand:
+        friendly_name = f"{friendly_name} ({brand})"
+    identifier = d.get("mac") or f"{user_id}_device_{idx}"
+    return {
+        "identifiers": {(DOMAIN, identifier)},
+        "name": friendly_name,
+        "manufacturer": brand or "Feelfit",
+        "model": model_info.get("model") or d.get("internal_model") or "Feelfit Device",
+    }
+
+def _build_views(payload: dict[str, Any]) -> None:
+    """Attach normalized per-profile views and device attributes to a payload."""
+    views: dict[str, dict[str, Any]] = {}
+    for profile_data in payload.get("profiles") or []:
+        user_info = profile_data.get("user_info") or {}
+        goals_list = (profile_data.get("goals") or {}).get("goals") or []
+        measurements_payload = profile_data.get("measurements") or {}
+        last_measurement = measurements_payload.get("last_measurement")
+        account_name = user_info.get("account_name") or "Unknown"
+        profile_data["_slug"] = account_name.lower().replace(" ", "_")
+        views[str(user_info.get("user_id"))] = {
+            "user_info": user_info,
+            "user_settings": profile_data.get("user_settings") or {},
+            # Reversed so the first goal of each type wins, as before.
+            "goals_by_type": {
+                g["goal_type"]: g.get("goal_value")
+                for g in reversed(goals_list)
+                if g.get("goal_type")
+            },
+            "last_measurement": last_measurement,
+            "measurement_attrs": (
+                {k: last_measurement[k] for k in _MEASUREMENT_ATTR_KEYS if k in last_measurement}
+                if last_measurement
+                else {}
+            ),
+            "device_info": (
+                _profile_device_info(user_info, None) if user_info.get("user_id") else None
+            ),
+            "time_stamp_iso": _iso_from_timestamp(
+                last_measurement.get("time_stamp") if last_measurement else None
+            ),
+        }
+    payload["_view"] = views
+
+    user_id = (payload.get("user_info") or {}).get("user_id")
+    for idx, d in enumerate((payload.get("device_binds") or {}).get("device_binds") or []):
+        d["_attrs"] = _device_attrs(d)
+        d["_device_info"] = _bound_device_info(d, idx, user_id)
+
+def _find_view(
+    data: dict[str, Any] | None, profile_user_id: str | None
+) -> dict[str, Any] | None:
+    """Return the view for a (string) user id, falling back to the first profile."""
+    views = (data or {}).get("_view") or {}
+    view = views.get(profile_user_id) if profile_user_id else None
+    if view is None:
+        view = next(iter(views.values()), None)
+    return view
+
+# (user_info key, label, unit, predicate deciding whether to create the sensor)
+_USER_SENSOR_SPECS: tuple[
+    tuple[str, str, str | None, Callable[[Any], bool]], ...
+] = (
+    ("account_name", "Account Name", None, lambda value: True),
+    ("weight", "Weight", KG_UNIT, lambda value: value is not None),
+    ("height", "Height", "cm", lambda value: value is not None),
+    ("email", "Email", None, bool),
+)
+
+_GOAL_UNITS = {"weight": KG_UNIT, "bodyfat": PERCENT, "water": "ml"}
+
+def _iter_user_sensors(
+    coordinator: DataUpdateCoordinator[dict[str, Any]],
+    entry_id: str,
+    user_info: dict[str, Any],
+    prefix: str,
+    display_prefix: str,
+    profile_user_id: str,
+) -> Iterator[SensorEntity]:
+    """Yield the account sensors for a profile."""
+    if not user_info:
+        return
+    for key, label, unit, wanted in _USER_SENSOR_SPECS:
+        if wanted(user_info.get(key)):
+            yield FeelfitUserSensor(
+                coordinator, entry_id,
+                f"{prefix}{key}",
+                key,
+                f"{display_prefix}{label}", unit, profile_user_id
+            )
+    if "birthday" in user_info:
+        yield FeelfitBirthdaySensor(
+            coordinator, entry_id, f"{prefix}birthday",
+            "birthday",
+            f"{display_prefix}Birthday", profile_user_id
+        )
+
+def _iter_goal_sensors(
+    coordinator: DataUpdateCoordinator[dict[str, Any]],
+    entry_id: str,
+    profile_data: dict[str, Any],
+    prefix: str,
+    profile_user_id: str,
+) -> Iterator[SensorEntity]:
+    """Yield one sensor per goal type of a profile."""
+    account_name = (profile_data.get("user_info") or {}).get("account_name")
+    goals_list = (profile_data.get("goals") or {}).get("goals") or []
+    debug = _LOGGER.isEnabledFor(logging.DEBUG)
+    if debug:
+        _LOGGER.debug("Profile %s: Processing %d goals", account_name, len(goals_list))
+    for g in goals_list:
+        g_type = g.get("goal_type")
+        if debug:
+            _LOGGER.debug(
+                "Profile %s goal: type=%s, value=%s, full_data=%s",
+                account_name, g_type, g.get("goal_value"), g
+            )
+        if not g_type:
+            _LOGGER.warning(
+                "Skipping goal with missing goal_type for profile %s: %s",
+                account_name, g
+            )
+            continue
+        yield FeelfitGoalSensor(
+            coordinator, entry_id, f"{prefix}goal_{g_type}", f"goal_{g_type}",
+            g_type, _GOAL_UNITS.get(g_type), profile_user_id
+        )
+
+def _iter_measurement_sensors(
+    coordinator: DataUpdateCoordinator[dict[str, Any]],
+    entry_id: str,
+    profile_data: dict[str, Any],
+    prefix: str,
+    display_prefix: str,
+    profile_user_id: str,
+) -> Iterator[SensorEntity]:
+    """Yield the measurement sensors for a profile with a last measurement."""
+    measurements_payload = profile_data.get("measurements") or {}
+    if not measurements_payload.get("last_measurement"):
+        return
+    for key, label, unit in _MEASUREMENT_KEYS:
+        yield FeelfitMeasurementSensor(
+            coordinator,
+            entry_id,
+            f"{prefix}measurement_{key}",
+            f"{display_prefix}{label}",
+            unit,
+            measurement_key=key,
+            profile_user_id=profile_user_id,
+        )
+
+def _iter_profile_sensors(
+    coordinator: DataUpdateCoordinator[dict[str, Any]],
+    entry_id: str,
+    profile_data: dict[str, Any],
+) -> Iterator[SensorEntity]:
+    """Yield every sensor for a profile."""
+    user_info = profile_data.get("user_info") or {}
+    profile_user_id = str(user_info.get("user_id", ""))
+    account_name = user_info.get("account_name") or "Unknown"
+    is_primary = user_info.get("is_primary", True)
+
+    prefix = "" if is_primary else f"{profile_data['_slug']}_"
+    display_prefix = "" if is_primary else f"{account_name} - "
+
+    if _LOGGER.isEnabledFor(logging.DEBUG):
+        _LOGGER.debug(
+            "Creating sensors for profile: %s (user_id=%s, is_primary=%s, prefix=%s)",
+            account_name, profile_user_id, is_primary, prefix
+        )
+
+    yield from _iter_user_sensors(
+        coordinator, entry_id, user_info, prefix, display_prefix, profile_user_id
+    )
+    yield from _iter_goal_sensors(coordinator, entry_id, profile_data, prefix, profile_user_id)
+    yield from _iter_measurement_sensors(
+        coordinator, entry_id, profile_data, prefix, display_prefix, profile_user_id
+    )
+
+def _iter_device_sensors(
+    coordinator: DataUpdateCoordinator[dict[str, Any]],
+    entry_id: str,
+    device_binds_payload: dict[str, Any],
+) -> Iterator[SensorEntity]:
+    """Yield one sensor per bound device."""
+    device_binds = (device_binds_payload or {}).get("device_binds") or []
+    for idx, d in enumerate(device_binds):
+        scale_name = d.get("scale_name") or d.get("internal_model") or f"device_{idx}"
+        yield FeelfitDeviceSensor(
+            coordinator, entry_id,
+            f"device_{idx}_{d.get('mac') or idx}",
+            f"Feelfit {scale_name}", None, device_index=idx
+        )
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -83,7 +420,9 @@ async def async_setup_entry(
                 str(user_id),
                 selected_profiles=selected_profiles if selected_profiles else None
             )
-            _LOGGER.debug("Feelfit coordinator fetched keys: %s", list(payload.keys()))
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug("Feelfit coordinator fetched keys: %s", list(payload))
+            _build_views(payload)
             return payload
         except Exception as err:
             _LOGGER.debug("Feelfit coordinator update failed: %s", err)
@@ -97,167 +436,63 @@ async def async_setup_entry(
         update_interval=SCAN_INTERVAL,
     )
 
-    await coordinator.async_refresh()
+    # Seed the coordinator with the fetch done during entry setup rather than
+    # fetching every profile a second time before the first update interval.
+    initial_payload = data.pop("initial_payload", None)
+    if initial_payload:
+        _build_views(initial_payload)
+        coordinator.async_set_updated_data(initial_payload)
+    else:
+        await coordinator.async_refresh()
     data_fetched = coordinator.data or {}
 
     profiles = data_fetched.get("profiles") or []
     device_binds_payload = data_fetched.get("device_binds") or {}
 
-    entities: list[SensorEntity] = []
-
-    for profile_data in profiles:
-        user_info = profile_data.get("user_info") or {}
-        profile_user_id = str(user_info.get("user_id", ""))
-        account_name = user_info.get("account_name") or "Unknown"
-        is_primary = user_info.get("is_primary", True)
-
-        prefix = "" if is_primary else f"{account_name.lower().replace(' ', '_')}_"
-        display_prefix = "" if is_primary else f"{account_name} - "
-
-        _LOGGER.debug(
-            "Creating sensors for profile: %s (user_id=%s, is_primary=%s, prefix=%s)",
-            account_name, profile_user_id, is_primary, prefix
+    entities: list[SensorEntity] = list(
+        itertools.chain(
+            itertools.chain.from_iterable(
+                _iter_profile_sensors(coordinator, entry.entry_id, profile_data)
+                for profile_data in profiles
+            ),
+            _iter_device_sensors(coordinator, entry.entry_id, device_binds_payload),
         )
+    )
 
-        if user_info:
-            entities.append(
-                FeelfitUserSensor(
-                    coordinator, entry.entry_id,
-                    f"{prefix}account_name",
-                    "account_name",
-                    f"{display_prefix}Account Name", None, profile_user_id
-                )
-            )
-            if user_info.get("weight") is not None:
-                entities.append(
-                    FeelfitUserSensor(
-                        coordinator, entry.entry_id,
-                        f"{prefix}weight",
-                        "weight",
-                        f"{display_prefix}Weight", KG_UNIT, profile_user_id
-                    )
-                )
-            if user_info.get("height") is not None:
-                entities.append(
-                    FeelfitUserSensor(
-                        coordinator, entry.entry_id,
-                        f"{prefix}height",
-                        "height",
-                        f"{display_prefix}Height", "cm", profile_user_id
-                    )
-                )
-            if "birthday" in user_info:
-                entities.append(
-                    FeelfitBirthdaySensor(
-                        coordinator, entry.entry_id, f"{prefix}birthday",
-                        "birthday",
-                        f"{display_prefix}Birthday", profile_user_id
-                    )
-                )
-            if user_info.get("email"):
-                entities.append(
-                    FeelfitUserSensor(
-                        coordinator, entry.entry_id,
-                        f"{prefix}email",
-                        "email",
-                        f"{display_prefix}Email", None, profile_user_id
-                    )
-                )
+    # The coordinator already holds fresh data; update_before_add would
+    # only schedule another full fetch through async_request_refresh.
+    async_add_entities(entities)
 
-        goals_payload = profile_data.get("goals") or {}
-        goals_list = goals_payload.get("goals") or []
-        _LOGGER.debug(
-            "Profile %s: Processing %d goals",
-            user_info.get("account_name"), len(goals_list)
-        )
-        for g in goals_list:
-            g_type = g.get("goal_type")
-            _LOGGER.debug(
-                "Profile %s goal: type=%s, value=%s, full_data=%s",
-                user_info.get("account_name"), g_type, g.get("goal_value"), g
-            )
-            if not g_type:
-                _LOGGER.warning(
-                    "Skipping goal with missing goal_type for profile %s: %s",
-                    user_info.get("account_name"), g
-                )
-                continue
-            unique_key = f"{prefix}goal_{g_type}"
-            translation_key = f"goal_{g_type}"
-            unit: str | None = None
-            if g_type == "weight":
-                unit = KG_UNIT
-            elif g_type == "bodyfat":
-                unit = PERCENT
-            elif g_type == "water":
-                unit = "ml"
-            entities.append(
-                FeelfitGoalSensor(
-                    coordinator, entry.entry_id, unique_key, translation_key, g_type, unit, profile_user_id
-                )
-            )
+class _ProfileViewMixin:
+    """Cache an entity's profile view, refreshed on each coordinator push."""
 
-        measurements_payload = profile_data.get("measurements") or {}
-        last_measurement = measurements_payload.get("last_measurement")
+    __slots__ = ("_view",)
 
-        if last_measurement:
-            measurement_keys: list[tuple[str, str, str | None]] = [
-                ("weight", "Weight", KG_UNIT),
-                ("bodyfat", "Bodyfat", PERCENT),
-                ("bmi", "BMI", None),
-                ("bmr", "BMR", KCAL),
-                ("bodyage", "Metabolic Age", "y"),
-                ("fat_free_weight", "Fat Free Weight", KG_UNIT),
-                ("muscle", "Muscle (%)", PERCENT),
-                ("protein", "Protein (%)", PERCENT),
-                ("sinew", "Sinew", PERCENT),
-                ("subfat", "Subcutaneous Fat (%)", PERCENT),
-                ("visfat", "Visceral Fat", None),
-                ("water", "Hydration (%)", PERCENT),
-                ("bone", "Bone Mass", KG_UNIT),
-                ("heart_rate", "Heart Rate", BPM),
-                ("score", "Score", None),
-                ("time_stamp", "Measurement Timestamp", None),
-                ("body_water_mass", "Body Water Mass", KG_UNIT),
-                ("protein_mass", "Protein Mass", KG_UNIT),
-                ("body_fat_mass", "Body Fat Mass", KG_UNIT),
-            ]
-
-            seen: set[str] = set()
-            for key, label, unit in measurement_keys:
-                if key in seen:
-                    continue
-                seen.add(key)
-                unique = f"{prefix}measurement_{key}"
-                name = f"{display_prefix}{label}"
-                entities.append(
-                    FeelfitMeasurementSensor(
-                        coordinator,
-                        entry.entry_id,
-                        unique,
-                        name,
-                        unit,
-                        measurement_key=key,
-                        profile_user_id=profile_user_id,
-                    )
-                )
-
-    device_binds = (device_binds_payload or {}).get("device_binds") or []
-    for idx, d in enumerate(device_binds):
-        scale_name = d.get("scale_name") or d.get("internal_model") or f"device_{idx}"
-        unique = f"device_{idx}_{d.get('mac') or idx}"
-        label = f"Feelfit {scale_name}"
-        entities.append(
-            FeelfitDeviceSensor(
-                coordinator, entry.entry_id, unique, label, None, device_index=idx
-            )
-        )
+    coordinator: DataUpdateCoordinator[dict[str, Any]]
+    _profile_user_id_str: str | None
+    _view: dict[str, Any] | None
 
-    async_add_entities(entities, True)
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Refresh the cached view before writing the new state."""
+        self._view = _find_view(self.coordinator.data, self._profile_user_id_str)
+        super()._handle_coordinator_update()
 
-class FeelfitUserSensor(CoordinatorEntity[DataUpdateCoordinator[dict[str, Any]]], SensorEntity):
+class FeelfitUserSensor(_ProfileViewMixin, CoordinatorEntity[DataUpdateCoordinator[dict[str, Any]]], SensorEntity):
     """Sensor for user info attributes."""
 
+    __slots__ = (
+        "_entry_id",
+        "_attr_key",
+        "_extra_attrs",
+        "_name",
+        "_unit",
+        "_profile_user_id",
+        "_profile_user_id_str",
+        "_fallback_device_info",
+        "_unique_id",
+    )
+
     def __init__(
         self,
         coordinator: DataUpdateCoordinator[dict[str, Any]],
@@ -272,9 +507,13 @@ class FeelfitUserSensor(CoordinatorEntity[DataUpdateCoordinator[dict[str, Any]]]
         super().__init__(coordinator)
         self._entry_id = entry_id
         self._attr_key = attr_key
+        self._extra_attrs = MappingProxyType({"source": "feelfit", "attribute": attr_key})
         self._name = name
         self._unit = unit
         self._profile_user_id = profile_user_id
+        self._profile_user_id_str = str(profile_user_id) if profile_user_id else None
+        self._view = _find_view(coordinator.data, self._profile_user_id_str)
+        self._fallback_device_info = _profile_device_info({}, entry_id)
 
         self._unique_id = f"{entry_id}_{unique_key}_{profile_user_id or 'primary'}"
         self._attr_translation_key = attr_key
@@ -293,58 +532,37 @@ class FeelfitUserSensor(CoordinatorEntity[DataUpdateCoordinator[dict[str, Any]]]
     @property
     def native_value(self) -> Any:
         """Return sensor value."""
-        profiles = (self.coordinator.data or {}).get("profiles") or []
-
-        user_info = None
-        for profile_data in profiles:
-            profile_info = profile_data.get("user_info") or {}
-            if self._profile_user_id and str(profile_info.get("user_id")) == str(self._profile_user_id):
-                user_info = profile_info
-                break
-
-        if not user_info and profiles:
-
-            user_info = profiles[0].get("user_info") or {}
-
+        view = self._view
+        user_info = (view or {}).get("user_info")
         if not user_info:
             return None
 
         return user_info.get(self._attr_key)
 
     @property
-    def extra_state_attributes(self) -> dict[str, Any]:
+    def extra_state_attributes(self) -> Mapping[str, Any]:
         """Return extra attributes."""
-        return {"source": "feelfit", "attribute": self._attr_key}
+        return self._extra_attrs
 
     @property
     def device_info(self) -> dict[str, Any]:
         """Return device info."""
-        profiles = (self.coordinator.data or {}).get("profiles") or []
+        view = self._view
+        return (view and view["device_info"]) or self._fallback_device_info
 
-        user_info = None
-        for profile_data in profiles:
-            profile_info = profile_data.get("user_info") or {}
-            if self._profile_user_id and str(profile_info.get("user_id")) == str(self._profile_user_id):
-                user_info = profile_info
-                break
-
-        if not user_info and profiles:
-            user_info = profiles[0].get("user_info") or {}
-
-        if not user_info:
-            user_info = {}
-
-        user_id = user_info.get("user_id") or self._entry_id
-        return {
-            "identifiers": {(DOMAIN, f"user_{user_id}")},
-            "name": user_info.get("account_name") or f"Feelfit User {user_id}",
-            "manufacturer": "Feelfit",
-            "model": "Feelfit Account",
-        }
-
-class FeelfitBirthdaySensor(CoordinatorEntity[DataUpdateCoordinator[dict[str, Any]]], SensorEntity):
+class FeelfitBirthdaySensor(_ProfileViewMixin, CoordinatorEntity[DataUpdateCoordinator[dict[str, Any]]], SensorEntity):
     """Sensor for birthday with date formatting."""
 
+    __slots__ = (
+        "_entry_id",
+        "_attr_key",
+        "_name",
+        "_profile_user_id",
+        "_profile_user_id_str",
+        "_fallback_device_info",
+        "_unique_id",
+    )
+
     def __init__(
         self,
         coordinator: DataUpdateCoordinator[dict[str, Any]],
@@ -360,6 +578,9 @@ class FeelfitBirthdaySensor(CoordinatorEntity[DataUpdateCoordinator[dict[str, An
         self._attr_key = attr_key
         self._name = name
         self._profile_user_id = profile_user_id
+        self._profile_user_id_str = str(profile_user_id) if profile_user_id else None
+        self._view = _find_view(coordinator.data, self._profile_user_id_str)
+        self._fallback_device_info = _profile_device_info({}, entry_id)
 
         self._unique_id = f"{entry_id}_{unique_key}_{profile_user_id or 'primary'}"
         self._attr_translation_key = attr_key
@@ -373,21 +594,11 @@ class FeelfitBirthdaySensor(CoordinatorEntity[DataUpdateCoordinator[dict[str, An
     @property
     def native_value(self) -> str | None:
         """Return formatted birthday."""
-        profiles = (self.coordinator.data or {}).get("profiles") or []
-
-        user_info = None
-        for profile_data in profiles:
-            profile_info = profile_data.get("user_info") or {}
-            if self._profile_user_id and str(profile_info.get("user_id")) == str(self._profile_user_id):
-                user_info = profile_info
-                user_settings = profile_data.get("user_settings") or {}
-                break
-
-        if not user_info and profiles:
-            user_info = profiles[0].get("user_info") or {}
-            user_settings = profiles[0].get("user_settings") or {}
-        elif not user_info:
+        view = self._view
+        if not view:
             return None
+        user_info = view["user_info"]
+        user_settings = view["user_settings"]
 
         raw = user_info.get("birthday")
         fmt = user_settings.get("date_format")
@@ -396,14 +607,8 @@ class FeelfitBirthdaySensor(CoordinatorEntity[DataUpdateCoordinator[dict[str, An
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return extra attributes."""
-        profiles = (self.coordinator.data or {}).get("profiles") or []
-
-        user_settings = {}
-        for profile_data in profiles:
-            profile_info = profile_data.get("user_info") or {}
-            if self._profile_user_id and str(profile_info.get("user_id")) == str(self._profile_user_id):
-                user_settings = profile_data.get("user_settings") or {}
-                break
+        view = self._view
+        user_settings = (view or {}).get("user_settings") or {}
 
         return {
             "source": "feelfit",
@@ -414,31 +619,23 @@ class FeelfitBirthdaySensor(CoordinatorEntity[DataUpdateCoordinator[dict[str, An
     @property
     def device_info(self) -> dict[str, Any]:
         """Return device info."""
-        profiles = (self.coordinator.data or {}).get("profiles") or []
-
-        user_info = None
-        for profile_data in profiles:
-            profile_info = profile_data.get("user_info") or {}
-            if self._profile_user_id and str(profile_info.get("user_id")) == str(self._profile_user_id):
-                user_info = profile_info
-                break
-
-        if not user_info and profiles:
-            user_info = profiles[0].get("user_info") or {}
-
-        if not user_info:
-            user_info = {}
-        user_id = user_info.get("user_id") or self._entry_id
-        return {
-            "identifiers": {(DOMAIN, f"user_{user_id}")},
-            "name": user_info.get("account_name") or f"Feelfit User {user_id}",
-            "manufacturer": "Feelfit",
-            "model": "Feelfit Account",
-        }
+        view = self._view
+        return (view and view["device_info"]) or self._fallback_device_info
 
-class FeelfitGoalSensor(CoordinatorEntity[DataUpdateCoordinator[dict[str, Any]]], SensorEntity):
+class FeelfitGoalSensor(_ProfileViewMixin, CoordinatorEntity[DataUpdateCoordinator[dict[str, Any]]], SensorEntity):
     """Sensor for goal values."""
 
+    __slots__ = (
+        "_entry_id",
+        "_unique_id",
+        "_unit",
+        "_goal_type",
+        "_extra_attrs",
+        "_profile_user_id",
+        "_profile_user_id_str",
+        "_fallback_device_info",
+    )
+
     def __init__(
         self,
         coordinator: DataUpdateCoordinator[dict[str, Any]],
@@ -456,7 +653,11 @@ class FeelfitGoalSensor(CoordinatorEntity[DataUpdateCoordinator[dict[str, Any]]]
         self._unique_id = f"{entry_id}_{unique_key}_{profile_user_id or 'primary'}"
         self._unit = unit
         self._goal_type = goal_type
+        self._extra_attrs = MappingProxyType({"source": "feelfit", "goal_type": goal_type})
         self._profile_user_id = profile_user_id
+        self._profile_user_id_str = str(profile_user_id) if profile_user_id else None
+        self._view = _find_view(coordinator.data, self._profile_user_id_str)
+        self._fallback_device_info = _profile_device_info({}, entry_id)
         self._attr_translation_key = translation_key
         self._attr_has_entity_name = True
 
@@ -473,59 +674,25 @@ class FeelfitGoalSensor(CoordinatorEntity[DataUpdateCoordinator[dict[str, Any]]]
     @property
     def native_value(self) -> Any:
         """Return goal value."""
-        profiles = (self.coordinator.data or {}).get("profiles") or []
-
-        goals_list = []
-        for profile_data in profiles:
-            profile_info = profile_data.get("user_info") or {}
-            if self._profile_user_id and str(profile_info.get("user_id")) == str(self._profile_user_id):
-                goals_payload = profile_data.get("goals") or {}
-                goals_list = goals_payload.get("goals") or []
-                break
-
-        if not goals_list and profiles:
-            goals_payload = profiles[0].get("goals") or {}
-            goals_list = goals_payload.get("goals") or []
-
-        for g in goals_list:
-            if g.get("goal_type") == self._goal_type:
-                return g.get("goal_value")
-        return None
+        view = self._view
+        return view["goals_by_type"].get(self._goal_type) if view else None
 
     @property
-    def extra_state_attributes(self) -> dict[str, Any]:
+    def extra_state_attributes(self) -> Mapping[str, Any]:
         """Return extra attributes."""
-        return {"source": "feelfit", "goal_type": self._goal_type}
+        return self._extra_attrs
 
     @property
     def device_info(self) -> dict[str, Any]:
         """Return device info."""
-        profiles = (self.coordinator.data or {}).get("profiles") or []
-
-        user_info = None
-        for profile_data in profiles:
-            profile_info = profile_data.get("user_info") or {}
-            if self._profile_user_id and str(profile_info.get("user_id")) == str(self._profile_user_id):
-                user_info = profile_info
-                break
-
-        if not user_info and profiles:
-            user_info = profiles[0].get("user_info") or {}
-
-        if not user_info:
-            user_info = {}
-
-        user_id = user_info.get("user_id") or self._entry_id
-        return {
-            "identifiers": {(DOMAIN, f"user_{user_id}")},
-            "name": user_info.get("account_name") or f"Feelfit User {user_id}",
-            "manufacturer": "Feelfit",
-            "model": "Feelfit Account",
-        }
+        view = self._view
+        return (view and view["device_info"]) or self._fallback_device_info
 
 class FeelfitDeviceSensor(CoordinatorEntity[DataUpdateCoordinator[dict[str, Any]]], SensorEntity):
     """Sensor for bound device info."""
 
+    __slots__ = ("_entry_id", "_device_index", "_unique_id", "_name", "_unit")
+
     def __init__(
         self,
         coordinator: DataUpdateCoordinator[dict[str, Any]],
@@ -572,41 +739,9 @@ class FeelfitDeviceSensor(CoordinatorEntity[DataUpdateCoordinator[dict[str, Any]
             (self.coordinator.data or {}).get("device_binds", {}).get("device_binds")
             or []
         )
-        attrs: dict[str, Any] = {}
         if len(device_binds) > self._device_index:
-            d = device_binds[self._device_index]
-            for key in (
-                "user_id",
-                "mac",
-                "scale_name",
-                "internal_model",
-                "created_at",
-                "wifi_name",
-                "functure_type",
-                "device_name",
-                "switch_states",
-                "blood_standard",
-                "light_strip_status",
-                "sn",
-                "scale_setting",
-            ):
-                if key in d:
-                    attrs[key] = d.get(key)
-
-            model_info = d.get("model_info")
-            if isinstance(model_info, dict):
-                for mk, mv in model_info.items():
-                    if mk == "brand_info" and isinstance(mv, dict):
-                        for bk, bv in mv.items():
-                            attrs[f"model_brand_{bk}"] = bv
-                        brand_name = mv.get("brand_name")
-                        if brand_name:
-                            attrs["brand_name"] = brand_name
-                    else:
-                        attrs[f"model_{mk}"] = mv
-            if d.get("model_info") is None and d.get("internal_model"):
-                attrs["model_internal_model"] = d.get("internal_model")
-        return attrs
+            return device_binds[self._device_index].get("_attrs") or {}
+        return {}
 
     @property
     def device_info(self) -> dict[str, Any]:
@@ -615,27 +750,10 @@ class FeelfitDeviceSensor(CoordinatorEntity[DataUpdateCoordinator[dict[str, Any]
             (self.coordinator.data or {}).get("device_binds", {}).get("device_binds")
             or []
         )
-        user_info = (self.coordinator.data or {}).get("user_info") or {}
-
         if len(device_binds) > self._device_index:
-            d = device_binds[self._device_index]
-            scale_name = (
-                d.get("scale_name") or d.get("internal_model") or f"Device {self._device_index}"
-            )
-            model_info = d.get("model_info") or {}
-            brand_info = model_info.get("brand_info") or {}
-            brand = d.get("brand_name") or brand_info.get("brand_name")
-            friendly_name = f"Feelfit {scale_name}"
-            if brand:
-                friendly_name = f"{friendly_name} ({brand})"
-            identifier = d.get("mac") or f"{user_info.get('user_id')}_device_{self._device_index}"
-            return {
-                "identifiers": {(DOMAIN, identifier)},
-                "name": friendly_name,
-                "manufacturer": brand or "Feelfit",
-                "model": model_info.get("model") or d.get("internal_model") or "Feelfit Device",
-            }
+            return device_binds[self._device_index]["_device_info"]
 
+        user_info = (self.coordinator.data or {}).get("user_info") or {}
         user_id = user_info.get("user_id")
         return {
             "identifiers": {(DOMAIN, f"{user_id}_device_{self._device_index}")},
@@ -644,9 +762,21 @@ class FeelfitDeviceSensor(CoordinatorEntity[DataUpdateCoordinator[dict[str, Any]
             "model": "Feelfit Device",
         }
 
-class FeelfitMeasurementSensor(CoordinatorEntity[DataUpdateCoordinator[dict[str, Any]]], SensorEntity):
+class FeelfitMeasurementSensor(_ProfileViewMixin, CoordinatorEntity[DataUpdateCoordinator[dict[str, Any]]], SensorEntity):
     """Sensor for measurement values."""
 
+    __slots__ = (
+        "_entry_id",
+        "_unique_id",
+        "_name",
+        "_unit",
+        "_measurement_key",
+        "_coerce",
+        "_profile_user_id",
+        "_profile_user_id_str",
+        "_fallback_device_info",
+    )
+
     def __init__(
         self,
         coordinator: DataUpdateCoordinator[dict[str, Any]],
@@ -665,7 +795,11 @@ class FeelfitMeasurementSensor(CoordinatorEntity[DataUpdateCoordinator[dict[str,
         self._name = name
         self._unit = unit
         self._measurement_key = measurement_key
+        self._coerce = _COERCERS.get(measurement_key, _coerce_number)
         self._profile_user_id = profile_user_id
+        self._profile_user_id_str = str(profile_user_id) if profile_user_id else None
+        self._view = _find_view(coordinator.data, self._profile_user_id_str)
+        self._fallback_device_info = _profile_device_info({}, entry_id)
         self._attr_translation_key = f"measurement_{measurement_key}"
         self._attr_has_entity_name = True
 
@@ -682,122 +816,32 @@ class FeelfitMeasurementSensor(CoordinatorEntity[DataUpdateCoordinator[dict[str,
     @property
     def native_value(self) -> Any:
         """Return measurement value."""
-        profiles = (self.coordinator.data or {}).get("profiles") or []
-
-        measurement = None
-        for profile_data in profiles:
-            profile_info = profile_data.get("user_info") or {}
-            if self._profile_user_id and str(profile_info.get("user_id")) == str(self._profile_user_id):
-                measurements_payload = profile_data.get("measurements") or {}
-                measurement = measurements_payload.get("last_measurement")
-                break
-
-        if not measurement and profiles:
-            measurements_payload = profiles[0].get("measurements") or {}
-            measurement = measurements_payload.get("last_measurement")
+        view = self._view
+        measurement = (view or {}).get("last_measurement")
 
         if not measurement:
-            _LOGGER.debug(
-                "FeelfitMeasurementSensor: no measurement for key %s",
-                self._measurement_key,
-            )
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug(
+                    "FeelfitMeasurementSensor: no measurement for key %s",
+                    self._measurement_key,
+                )
             return None
 
         raw_val = measurement.get(self._measurement_key)
 
-        if self._measurement_key == "time_stamp" and raw_val:
-            try:
-                ts = int(raw_val)
-                dt = datetime.fromtimestamp(ts)
-                return dt.isoformat()
-            except (ValueError, OSError):
-                return str(raw_val)
-
-        if isinstance(raw_val, (int, float)):
-            if self._measurement_key in ("bodyage", "measurement_id", "user_id"):
-                try:
-                    return int(raw_val)
-                except (ValueError, TypeError):
-                    return raw_val
-            try:
-                fval = float(raw_val)
-                if fval.is_integer():
-                    return int(fval)
-                return round(fval, 2)
-            except (ValueError, TypeError):
-                return raw_val
-
-        if isinstance(raw_val, str):
-            cleaned = raw_val.replace(".", "", 1)
-            if cleaned.isdigit() or (cleaned.startswith("-") and cleaned[1:].isdigit()):
-                try:
-                    if "." in raw_val:
-                        fval = float(raw_val)
-                        if fval.is_integer():
-                            return int(fval)
-                        return round(fval, 2)
-                    return int(raw_val)
-                except (ValueError, TypeError):
-                    pass
-            return raw_val
-
-        return raw_val
+        if self._measurement_key == "time_stamp":
+            return view["time_stamp_iso"]
+
+        return self._coerce(raw_val) if raw_val is not None else None
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return extra attributes."""
-        profiles = (self.coordinator.data or {}).get("profiles") or []
-
-        measurement = None
-        for profile_data in profiles:
-            profile_info = profile_data.get("user_info") or {}
-            if self._profile_user_id and str(profile_info.get("user_id")) == str(self._profile_user_id):
-                measurements_payload = profile_data.get("measurements") or {}
-                measurement = measurements_payload.get("last_measurement")
-                break
-
-        if not measurement and profiles:
-            measurements_payload = profiles[0].get("measurements") or {}
-            measurement = measurements_payload.get("last_measurement")
-
-        attrs: dict[str, Any] = {}
-        if measurement:
-            for k in (
-                "measurement_id",
-                "user_id",
-                "scale_name",
-                "internal_model",
-                "mac",
-                "parameter",
-                "accuracy_flag",
-                "measure_mode_flags",
-            ):
-                if k in measurement:
-                    attrs[k] = measurement.get(k)
-        return attrs
+        view = self._view
+        return view["measurement_attrs"] if view else {}
 
     @property
     def device_info(self) -> dict[str, Any]:
         """Return device info."""
-        profiles = (self.coordinator.data or {}).get("profiles") or []
-
-        user_info = None
-        for profile_data in profiles:
-            profile_info = profile_data.get("user_info") or {}
-            if self._profile_user_id and str(profile_info.get("user_id")) == str(self._profile_user_id):
-                user_info = profile_info
-                break
-
-        if not user_info and profiles:
-            user_info = profiles[0].get("user_info") or {}
-
-        if not user_info:
-            user_info = {}
-
-        user_id = user_info.get("user_id") or self._entry_id
-        return {
-            "identifiers": {(DOMAIN, f"user_{user_id}")},
-            "name": user_info.get("account_name") or f"Feelfit User {user_id}",
-            "manufacturer": "Feelfit",
-            "model": "Feelfit Account",
-        }
+        view = self._view
+        return (view and view["device_info"]) or self._fallback_device_info